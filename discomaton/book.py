@@ -621,7 +621,7 @@ class AbstractBooklet(AbstractIterableMachine, abc.ABC, typing.Generic[PageType]
             # permission.
             await root.add_reaction(reaction)
         except BaseException as ex:
-            self.logger.debug(f"IGNORING API ERROR {type(ex).__name__}: {ex}")
+            self.logger.debug("IGNORING API ERROR %s: %s", type(ex).__name__, ex)
 
     async def _maybe_clear_reactions(self) -> None:
         try:
@@ -629,7 +629,7 @@ class AbstractBooklet(AbstractIterableMachine, abc.ABC, typing.Generic[PageType]
             if msg:
                 await msg.clear_reactions()
         except BaseException as ex:
-            self.logger.debug(f"IGNORING API ERROR {type(ex).__name__}: {ex}")
+            self.logger.debug("IGNORING API ERROR %s: %s", type(ex).__name__, ex)
 
     async def _flush_reacts(self) -> None:
         """
@@ -134,11 +134,10 @@ class Paginator:
         # mid word, if possible.
         for bit in self._bits:
             if not isinstance(bit, DontAlter) and bit is not self._page_break:
-                bit = str(bit)
-                while " " in bit:
-                    first_bit, space, rest = bit.partition(" ")
-                    bits.append(first_bit + space)
-                    bit = rest
+                # Split in one pass. Partitioning repeatedly copies the rest of
+                # the string each time, which is quadratic on large input.
+                *words, bit = str(bit).split(" ")
+                bits.extend(word + " " for word in words)
             bits.append(bit)
 
         def finish_page():
@@ -47,8 +47,31 @@ class Stack(collections.Sequence, typing.Generic[StackType]):
         :param items: the items to add to the stack initially.
         """
         self._stack = []
+        # How many times each hashable item is on the stack, so membership
+        # tests don't scan the list. Unhashable items are only counted.
+        self._counts = {}
+        self._unhashable = 0
         if items:
             self._stack.extend(items)
+            for item in self._stack:
+                self._track(item)
+
+    def _track(self, x: object) -> None:
+        """Records that the item was added to the stack."""
+        try:
+            self._counts[x] = self._counts.get(x, 0) + 1
+        except TypeError:
+            self._unhashable += 1
+
+    def _untrack(self, x: object) -> None:
+        """Records that the item was removed from the stack."""
+        try:
+            count = self._counts.pop(x)
+        except TypeError:
+            self._unhashable -= 1
+        else:
+            if count > 1:
+                self._counts[x] = count - 1
 
     def __len__(self) -> int:
         """Get the stack length."""
@@ -60,6 +83,16 @@ class Stack(collections.Sequence, typing.Generic[StackType]):
 
     def __contains__(self, x: object) -> bool:
         """Determine if the given object is in the stack."""
+        try:
+            if x in self._counts:
+                return True
+        except TypeError:
+            pass
+        else:
+            if not self._unhashable:
+                return False
+
+        # Unhashable objects may still compare equal, so check the slow way.
         return x in self._stack
 
     def __getitem__(self, index: int) -> StackType:
@@ -75,20 +108,35 @@ class Stack(collections.Sequence, typing.Generic[StackType]):
         :param index: the index to edit at.
         :param value: the value to edit at.
         """
-        self._stack[index] = value
+        # Assign first, so that a bad index or slice leaves the counts alone.
+        old = self._stack[index]
+        if isinstance(index, slice):
+            value = list(value)
+            self._stack[index] = value
+        else:
+            self._stack[index] = value
+            old, value = [old], [value]
+
+        for item in old:
+            self._untrack(item)
+        for item in value:
+            self._track(item)
 
     def push(self, x: StackType) -> StackType:
         """Pushes the item onto the stack and returns it."""
         self._stack.append(x)
+        self._track(x)
         return x
 
     def pop(self) -> StackType:
         """Pops from the stack."""
-        return self._stack.pop()
+        x = self._stack.pop()
+        self._untrack(x)
+        return x
 
     def flip(self) -> None:
         """Flips the stack into reverse order in place."""
-        self._stack = list(reversed(self._stack))
+        self._stack.reverse()
 
     def __str__(self) -> str:
         """Gets the string representation of the stack."""
@@ -38,15 +38,17 @@ from neko2.shared import commands, traits
 class CatCog(traits.CogTraits):
     @commands.command(brief="Gets a random cat!")
     async def cat(self, ctx):
-        # This endpoint will redirect us.
+        # This endpoint will redirect us. We only care about where to, so
+        # don't bother downloading the image itself.
         conn = await self.acquire_http()
-        resp = await conn.get("http://thecatapi.com/api/images/get")
-        url = resp.url
+        async with conn.head(
+            "http://thecatapi.com/api/images/get", allow_redirects=True
+        ) as resp:
+            url = str(resp.url)
         e = discord.Embed()
         e.set_image(url=url)
         e.set_footer(text="Provided by TheCatAPI")
         await ctx.send(embed=e)
-        await resp.release()
 
 
 def setup(bot):
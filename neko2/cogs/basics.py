@@ -54,6 +54,8 @@ import inspect  # Introspection
 import io
 import os
 import random
+import re
+import shlex
 import shutil
 import subprocess  # Sync subprocess.
 import sys  # System streams and bits
@@ -65,7 +67,6 @@ import async_timeout
 import aiohttp
 from cached_property import cached_property
 import discord
-from discord.ext import commands as dpycmds
 from discord import embeds  # Embeds.
 import websockets
 
@@ -80,6 +81,9 @@ from neko2.engine import extrabits
 
 lines_of_code = None
 
+# Matches the start of every line. Used to comment out tracebacks in logs.
+_line_start_re = re.compile(r"^", re.MULTILINE)
+
 
 def count_loc():
     """
@@ -119,6 +123,11 @@ class BasicsCog(traits.CogTraits):
 
         self.bot = bot
 
+        # Used by update. Looked up once, as each lookup walks the $PATH.
+        # The update script is POSIX shell, so we always want sh, not $SHELL.
+        self._git_path = shutil.which("git")
+        self._sh_path = shutil.which("sh") or "/bin/sh"
+
     # Prevents webhook exploits spamming the hell out of this.
     async def __global_check(self, ctx):
         """
@@ -1248,7 +1257,7 @@ class BasicsCog(traits.CogTraits):
         should_mute = "--mute" in args or "-m" in args
 
         # Ensure git is installed first
-        git_path = shutil.which("git")
+        git_path = self._git_path
 
         commands.acknowledge(ctx)
 
@@ -1265,88 +1274,132 @@ class BasicsCog(traits.CogTraits):
                 else:
                     return await ctx.author.send(".git is not a directory")
             else:
-                return ctx.author.send(".git does not exist. Is this a repo?")
-
-            with io.StringIO() as out_s:
-                shell = os.getenv("SHELL")
-                if shell is None:
-                    shell = shutil.which("sh")
-                    if shell is None:
-                        shell = "?? "
-
-                async def call(cmd):
-                    nonlocal did_fail
-                    out_s.write(f"{shell} -c {cmd}")
-                    process = await asyncio.create_subprocess_shell(
-                        cmd,
-                        # encoding='utf-8',
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    out_s.write(f"> Invoked PID {process.pid}\n")
-                    # Might deadlock?
-                    out_s.write((await process.stdout.read()).decode())
-                    out_s.write((await process.stderr.read()).decode())
-                    code = process.returncode if process.returncode else 0
+                return await ctx.author.send(".git does not exist. Is this a repo?")
 
-                    if code:
-                        did_fail = True
-                    out_s.write(f"> Terminated with code {code}\n\n")
+            out_parts = []
+            sh_path = self._sh_path
+            git = shlex.quote(git_path)
 
-                try:
-                    await call(f"{git_path} fetch --all")
-                    print("The following changes will be lost:")
-                    await call(f"{git_path} diff --stat HEAD origin/master")
-                    print("And replaced with")
-                    await call(
-                        f"{git_path} show --stat | " 'sed "s/<.*@.*[.].*>/<email>/g"'
-                    )
-                    print()
-                    print("Status:")
-                    await call(f"{git_path} status --porcelain")
-                    print()
-                    print("Overwriting local history with remote history.")
-                    await call(
-                        f"{git_path} reset --hard origin/$(git "
-                        "rev-parse --symbolic-full-name --abbrev-ref "
-                        "HEAD)"
-                    )
-                    await call(
-                        f"{git_path} stash list && {git_path} stash " "drop; true"
-                    )
-                except BaseException as ex:
-                    err = traceback.format_exception(type(ex), ex, ex.__traceback__)
-                    # Seems that lines might have newlines. This is annoying.
+            # Label and command for each step of the update.
+            steps = (
+                ("Fetching remote history", f"{git} fetch --all"),
+                (
+                    "The following changes will be lost",
+                    f"{git} diff --stat HEAD origin/master",
+                ),
+                (
+                    "And replaced with",
+                    f"{git} show --stat | " 'sed "s/<.*@.*[.].*>/<email>/g"',
+                ),
+                (
+                    "Status",
+                    # Only tells us if the tree is dirty, but doesn't have
+                    # to scan the whole work tree like `status` does. The
+                    # refresh stops files that were only touched from being
+                    # reported as changed.
+                    f"{git} update-index -q --refresh; "
+                    f"{git} diff-index --quiet HEAD -- "
+                    '&& echo "Working tree is clean" '
+                    '|| echo "Working tree has local changes"',
+                ),
+                (
+                    "Overwriting local history with remote history",
+                    f"{git} reset --hard origin/$({git} "
+                    "rev-parse --symbolic-full-name --abbrev-ref "
+                    "HEAD)",
+                ),
+                (
+                    "Dropping the stash",
+                    f"{git} stash list && {git} stash drop; true",
+                ),
+            )
 
-                    err = "".join(err).split("\n")
-                    err = [f"# {e_ln}\n" for e_ln in err]
+            # Run every step in one shell rather than spawning a process
+            # per step. Each step prints a sentinel holding its exit code
+            # afterwards, so the output can be split back up per step. The
+            # sentinel goes on a new line, in case the output didn't end
+            # with one.
+            sentinel = "#neko2-step-exited-with:"
+            script = "; ".join(
+                f"{{ {cmd} ; }} 2>&1; printf '\\n{sentinel}%d\\n' $?"
+                for _, cmd in steps
+            )
 
-                    # Remove last comment.
-                    err = "".join(err)[:-1]
-                    out_s.write(err)
-                    traceback.print_exception(type(ex), ex, ex.__traceback__)
-                    did_fail = True
-                finally:
-                    log = out_s.getvalue()
+            async def call(*argv):
+                # Forking blocks until the child has exec'd, so spawn on
+                # the IO pool rather than stalling the event loop. The
+                # pipes are blocking file objects, so drain them there too.
+                process = await self.run_in_io_executor(
+                    subprocess.Popen,
+                    [argv],
+                    {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE},
+                )
+                out_parts.append(f"> Invoked PID {process.pid}\n\n")
+                # Drains both pipes at once and reaps the process, so a
+                # full stderr pipe can't block us while we read stdout.
+                stdout, stderr = await self.run_in_io_executor(process.communicate)
+                return (
+                    stdout.decode(errors="replace"),
+                    stderr.decode(errors="replace"),
+                )
 
-                    self.logger.warning(
-                        f"{ctx.author} Invoked destructive update from "
-                        f"{ctx.guild}@#{ctx.channel}\n{log}"
-                    )
+            try:
+                stdout, stderr = await call(sh_path, "-c", script)
+
+                sections, current = [], []
+                for line in stdout.splitlines(keepends=True):
+                    if line.startswith(sentinel):
+                        code = int(line[len(sentinel) :])
+                        # Drop the newline printed before the sentinel.
+                        output = "".join(current)[:-1]
+                        sections.append((output, code))
+                        current = []
+                    else:
+                        current.append(line)
 
-                    p = dpycmds.Paginator()
+                for (label, cmd), (output, code) in zip(steps, sections):
+                    out_parts.append(f"> {label}\n{sh_path} -c {cmd}\n")
+                    out_parts.append(output)
+                    if output and not output.endswith("\n"):
+                        out_parts.append("\n")
+                    if code:
+                        did_fail = True
+                    out_parts.append(f"> Terminated with code {code}\n\n")
 
-                    for line in log.split("\n"):
-                        p.add_line(line)
+                if len(sections) < len(steps):
+                    # The shell died before running everything.
+                    out_parts.append("".join(current))
+                    out_parts.append("> Not every step was run\n")
+                    did_fail = True
 
-                    if not should_mute:
-                        await ctx.author.send(
-                            f"Will send {len(p.pages)} messages of output!"
-                        )
+                out_parts.append(stderr)
+            except BaseException as ex:
+                err = traceback.format_exception(type(ex), ex, ex.__traceback__)
+                # Seems that lines might have newlines, so join them all
+                # before commenting out each line.
+                out_parts.append(_line_start_re.sub("# ", "".join(err)))
+                traceback.print_exception(type(ex), ex, ex.__traceback__)
+                did_fail = True
+            finally:
+                log = "".join(out_parts)
+
+                self.logger.warning(
+                    f"{ctx.author} Invoked destructive update from "
+                    f"{ctx.guild}@#{ctx.channel}\n{log}"
+                )
+
+                p = discomaton.Paginator(max_lines=None, prefix="```", suffix="```")
+                p.add(log)
+                # Paging walks the log a character at a time, which is slow
+                # for a big log, so keep it off the event loop.
+                pages = await self.run_in_io_executor(lambda: p.pages)
+
+                if not should_mute:
+                    await ctx.author.send(f"Will send {len(pages)} messages of output!")
 
-                        for page in p.pages:
-                            if page:
-                                await ctx.author.send(page)
+                    for page in pages:
+                        if page:
+                            await ctx.author.send(page)
 
         if did_fail:
             await ctx.author.send(
@@ -57,10 +57,10 @@ class MewReactsCog(scribe.Scribe):
         for target in potential_targets:
             path = os.path.join(assets_directory, target)
             if os.path.exists(path) and os.path.isfile(path):
-                self.logger.debug(f"Discovered {path}.")
+                self.logger.debug("Discovered %s.", path)
                 targets_to_path[target] = path
             else:
-                self.logger.warning(f"Could not find {path}. Excluding image.")
+                self.logger.warning("Could not find %s. Excluding image.", path)
 
         self.images = {}
 
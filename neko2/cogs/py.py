@@ -28,18 +28,70 @@ LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import asyncio
+import bisect
 import contextlib
 import io
+import itertools
+import re
+import time
 from urllib import parse
-import xmlrpc.client as xmlrpcclient
 
 import discord
+import orjson
 
 from discomaton.factories import bookbinding
 from neko2.shared import alg, commands, string, traits
 
+# PEP 691 JSON flavour of the simple repository API.
+simple_index_url = "https://pypi.org/simple/"
+simple_index_accept = "application/vnd.pypi.simple.v1+json"
+
+# Runs of these characters are all equivalent in a PEP 503 normalised name.
+_name_separators_re = re.compile(r"[-_.]+")
+
+
+def normalise_name(name):
+    """Normalises a project name as described in PEP 503."""
+    return _name_separators_re.sub("-", name).lower()
+
+
+def search_names(index, query, limit):
+    """
+    Finds up to `limit` names in the sorted `index` starting with the query.
+    If there are none, we fall back to any names containing the query instead.
+    """
+    query = normalise_name(query)
+
+    start = bisect.bisect_left(index, query)
+    names = list(
+        itertools.takewhile(lambda n: n.startswith(query), index[start : start + limit])
+    )
+
+    if not names:
+        names = list(itertools.islice((n for n in index if query in n), limit))
+
+    return names
+
 
 class PyCog(traits.CogTraits):
+    # Seconds to keep the list of PyPI project names for before refreshing.
+    simple_index_ttl = 60 * 60
+
+    # Most results to show for a search.
+    max_search_results = 50
+
+    # Most package lookups to have in flight at once for a search.
+    max_concurrent_lookups = 10
+
+    # Swaps backticks for primes so help() output can't escape code blocks.
+    _backtick_trans = str.maketrans({"`": "′"})
+
+    def __init__(self):
+        self._simple_index = []
+        self._simple_index_time = None
+        self._simple_index_lock = asyncio.Lock()
+
     @commands.command(brief="Shows Python documentation.")
     async def py(self, ctx, member):
         """Gets some help regarding the given Python member, if it exists..."""
@@ -49,9 +101,7 @@ class PyCog(traits.CogTraits):
                 with contextlib.redirect_stdout(buff):
                     with contextlib.redirect_stderr(buff):
                         help(member)
-                data = buff.getvalue().splitlines()
-
-                return data
+                return buff.getvalue().translate(self._backtick_trans)
 
         data = await self.run_in_io_executor(executor)
 
@@ -59,9 +109,7 @@ class PyCog(traits.CogTraits):
             ctx, max_lines=20, prefix="```markdown", suffix="```"
         )
 
-        for line in data:
-            line = line.replace("`", "′")
-            bb.add_line(line)
+        bb.add(data)
 
         bb.start()
 
@@ -79,20 +127,29 @@ class PyCog(traits.CogTraits):
                 "Please provide at least two characters.", delete_after=10
             )
 
-        def executor():
-            # https://wiki.python.org/moin/PyPIXmlRpc
-            # TODO: find a less shit way to do this
-            # This is deprecated.
-            client = xmlrpcclient.ServerProxy("https://pypi.python.org/pypi")
-            return client.search({"name": package})
-
         with ctx.typing():
-            results = await self.run_in_io_executor(executor)
+            names = await self._search_simple_index(package)
+
+            conn = await self.acquire_http()
+            semaphore = asyncio.Semaphore(self.max_concurrent_lookups)
+
+            async def get_info(name):
+                url = f"https://pypi.org/pypi/{parse.quote(name)}/json"
+                async with semaphore, conn.get(url=url) as resp:
+                    if 200 <= resp.status < 300:
+                        return orjson.loads(await resp.read())["info"]
+
+            # Only the names come from the index, so get the rest of what we
+            # display for each result at the same time.
+            results = await asyncio.gather(
+                *(get_info(name) for name in names), return_exceptions=True
+            )
+            results = [result for result in results if isinstance(result, dict)]
 
         book = bookbinding.StringBookBinder(ctx, max_lines=None)
 
         head = f"**__Search results for `{package}`__**\n"
-        for i, result in enumerate(results[:50]):
+        for i, result in enumerate(results):
             if not i % 5:
                 book.add_break()
                 book.add_line(head)
@@ -113,6 +170,52 @@ class PyCog(traits.CogTraits):
         except IndexError:
             await ctx.send("No results were found...", delete_after=10)
 
+    async def _get_simple_index(self):
+        """
+        Gets a sorted list of the PEP 503 normalised name of every project on
+        PyPI. This is cached for `simple_index_ttl` seconds.
+        """
+        async with self._simple_index_lock:
+            now = time.monotonic()
+            if (
+                self._simple_index_time is None
+                or now - self._simple_index_time > self.simple_index_ttl
+            ):
+                conn = await self.acquire_http()
+                headers = {"Accept": simple_index_accept}
+                async with conn.get(simple_index_url, headers=headers) as resp:
+                    resp.raise_for_status()
+                    raw = await resp.read()
+
+                # There are hundreds of thousands of projects, so parsing and
+                # sorting them would stall the event loop.
+                self._simple_index = await self.run_in_io_executor(
+                    self._parse_simple_index, [raw]
+                )
+                self._simple_index_time = now
+
+            return self._simple_index
+
+    @staticmethod
+    def _parse_simple_index(raw):
+        """Parses the simple index response into a sorted list of names."""
+        data = orjson.loads(raw)
+        # The index gives display names, like `zope.interface`, so normalise
+        # them to match normalised queries.
+        return sorted(normalise_name(project["name"]) for project in data["projects"])
+
+    async def _search_simple_index(self, query):
+        """
+        Finds the normalised names of projects on PyPI matching the query.
+        """
+        index = await self._get_simple_index()
+        # The substring fallback scans every project on PyPI, which would
+        # stall the event loop. The index is replaced, never mutated, so it
+        # is safe to read from another thread.
+        return await self.run_in_io_executor(
+            search_names, [index, query, self.max_search_results]
+        )
+
     @pypi.command(brief="Shows info for a specific PyPI package.")
     async def info(self, ctx, package):
         """
@@ -124,8 +227,9 @@ class PyCog(traits.CogTraits):
         # Requests is fine though. Guess I have to use that...
         with ctx.typing():
             conn = await self.acquire_http()
-            resp = await conn.get(url=url)
-            result = (await resp.json()) if 200 <= resp.status < 300 else None
+            async with conn.get(url=url) as resp:
+                ok = 200 <= resp.status < 300
+                result = orjson.loads(await resp.read()) if ok else None
 
         if result:
             data = result["info"]
@@ -141,14 +245,9 @@ class PyCog(traits.CogTraits):
             # Shortens the classifier strings.
             classifiers = data.get("classifiers", [])
             if classifiers:
-                fixed_classifiers = []
-                for classifier in classifiers:
-                    print()
-                    if "::" in classifier:
-                        _, _, classifier = classifier.rpartition("::")
-                    classifier = f"`{classifier.strip()}`"
-                    fixed_classifiers.append(classifier)
-                classifiers = ", ".join(sorted(fixed_classifiers))
+                classifiers = ", ".join(
+                    sorted(f"`{c.rpartition('::')[2].strip()}`" for c in classifiers)
+                )
 
             other_attrs = {
                 "License": data.get("license"),
@@ -34,17 +34,19 @@ LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import asyncio
+import functools
 import sys
+import time
 import traceback
 
 import discord
+import orjson
 
 from neko2.shared import commands, traits
 
 api_endpoint = "https://steamgaug.es/api/v2"
 
-steam_core_services = {"ISteamClient", "SteamCommunity", "SteamStore", "ISteamUser"}
-
 service_names = {
     "ISteamClient": "Steam Client API",
     "SteamCommunity": "Community API",
@@ -55,6 +57,12 @@ service_names = {
     "ISteamGameCoordinator": "Game Coordinator",
 }
 
+# Services shown by the steam command, in order, with their display names.
+steam_core_services = tuple(
+    (service, service_names[service])
+    for service in ("ISteamClient", "SteamCommunity", "SteamStore", "ISteamUser")
+)
+
 game_icon = (
     "http://cdn.edgecast.steamstatic.com/steamcommunity/public/images"
     "/avatars/6f/6f9b7a6739b06a8ec55d55ef4131782ab2a0f0af.jpg"
@@ -70,200 +78,198 @@ game_thumbs = {
 
 steam_color = 0x171a21
 
+# Handlers for the generic fields of a service. Each takes the field's value
+# and gives the name and value to display, or None to leave the field out.
+generic_field_handlers = {
+    "time": lambda value: ("Latency", f"{value}ms"),
+    "online": lambda value: ("Status", "OK" if value == 1 else "Degraded"),
+    "error": lambda value: None if value == "No Error" else ("Error", value),
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _pretty(key):
+    """Turns a field key into a display name. The API reuses the same few keys."""
+    return key.replace("_", " ").title()
+
 
 class SteamStatusCog(traits.CogTraits):
+    # Seconds to reuse a SteamGauges response for before fetching a new one.
+    status_ttl = 15
+
+    def __init__(self):
+        self._status = None
+        self._status_time = None
+        self._status_lock = asyncio.Lock()
+        # Embed fields per command, formatted from the current response.
+        self._fields = {}
+
     @commands.command(brief="Gets the Steam API status.")
     async def steam(self, ctx):
         """
         Replies to the given context with the steam status as a formatted embed
         """
+        await self._send_status(ctx, "Steam API status", "steam")
 
-        # Format the response.
-        embed = discord.Embed(
-            title="Steam API status", color=steam_color, url="https://steamgaug.es"
-        )
+    @commands.command(brief="Gets the CSGO API status.")
+    async def csgo(self, ctx):
+        await self._send_status(ctx, "CS:GO API status", "csgo")
 
-        embed.set_footer(text="Powered by SteamGauges API v2", icon_url=game_icon)
+    @commands.command(brief="Gets the Dota 2 API status.", aliases=["dota"])
+    async def dota2(self, ctx):
+        await self._send_status(ctx, "Dota 2 API status", "dota2")
 
-        embed.set_thumbnail(url=game_thumbs["steam"])
+    @commands.command(brief="Gets the Team Fortress 2 API status.")
+    async def tf2(self, ctx):
+        await self._send_status(ctx, "Team Fortress 2 API status", "tf2")
+
+    async def _send_status(self, ctx, title, game):
+        """Replies with the status embed for the given game."""
+        embed = self._make_embed(title, game)
 
         with ctx.typing():
-            resp = await self.get_status()
+            fields = await self.get_fields(game)
 
-        for service in steam_core_services:
-            if service not in resp:
-                self.unrecognised_field(resp, service)
+        for name, value, inline in fields:
+            embed.add_field(name=name, value=value, inline=inline)
 
-            service_name = service_names[service]
-            data = resp[service]
+        await ctx.send(embed=embed)
 
-            strings = []
+    async def get_fields(self, game):
+        """
+        Gets the embed fields to show for the given game. These are formatted
+        once per response and shared by every call until the status is
+        fetched again.
+        """
+        resp = await self.get_status()
+        # get_status replaces this dict whenever it fetches, so read it
+        # straight after, before anything else gets a chance to run.
+        cache = self._fields
 
-            for k, v in data.items():
-                val = self.parse_generic_field(resp, k, v)
-                if val:
-                    strings.append(val)
+        if game not in cache:
+            cache[game] = getattr(self, f"_{game}_fields")(resp)
 
-            if not strings:
-                strings = ["No data"]
+        return cache[game]
 
-            embed.add_field(name=service_name, value="\n".join(strings))
+    def _steam_fields(self, resp):
+        fields = []
 
-        await ctx.send(embed=embed)
+        for service, service_name in steam_core_services:
+            if service not in resp:
+                self.unrecognised_field(resp, service)
 
-    @commands.command(brief="Gets the CSGO API status.")
-    async def csgo(self, ctx):
-        embed = discord.Embed(
-            title="CS:GO API status", color=steam_color, url="https://steamgaug.es"
-        )
+            fields.append(
+                (service_name, self._render_service(resp, resp[service]), True)
+            )
 
-        embed.set_footer(text="Powered by SteamGauges API v2", icon_url=game_icon)
+        return fields
 
-        embed.set_thumbnail(url=game_thumbs["csgo"])
+    def _csgo_fields(self, resp):
+        fields = []
 
-        with ctx.typing():
-            resp = await self.get_status()
-
-        item_server_str = []
-        for k, v in resp["IEconItems"]["730"].items():
-            val = self.parse_generic_field(resp, k, v)
-            if val:
-                item_server_str.append(val)
-
-        coordinator_str = []
-        for k, v in resp["ISteamGameCoordinator"]["730"].items():
-            if k == "stats":
-                embed.add_field(
-                    name="Stats", value=self.parse_stat_list(v), inline=False
-                )
-            else:
-                val = self.parse_generic_field(resp, k, v)
-                if val:
-                    coordinator_str.append(val)
-
-        embed.add_field(
-            name=service_names["IEconItems"],
-            value="\n".join(item_server_str if item_server_str else ["No data"]),
-        )
+        coordinator = resp["ISteamGameCoordinator"]["730"]
+        stats = coordinator.get("stats")
+        if stats is not None:
+            fields.append(("Stats", self.parse_stat_list(stats), False))
 
-        embed.add_field(
-            name=service_names["ISteamGameCoordinator"],
-            value="\n".join(coordinator_str if coordinator_str else ["No data"]),
+        fields.append(
+            (
+                service_names["IEconItems"],
+                self._render_service(resp, resp["IEconItems"]["730"]),
+                True,
+            )
         )
 
-        await ctx.send(embed=embed)
-
-    @commands.command(brief="Gets the Dota 2 API status.", aliases=["dota"])
-    async def dota2(self, ctx):
-        embed = discord.Embed(
-            title="Dota 2 API status", color=steam_color, url="https://steamgaug.es"
+        fields.append(
+            (
+                service_names["ISteamGameCoordinator"],
+                self._render_service(resp, coordinator, skip=("stats",)),
+                True,
+            )
         )
 
-        embed.set_footer(text="Powered by SteamGauges API v2", icon_url=game_icon)
+        return fields
 
-        embed.set_thumbnail(url=game_thumbs["dota2"])
+    def _dota2_fields(self, resp):
+        fields = []
 
-        with ctx.typing():
-            resp = await self.get_status()
-
-        item_server_str = []
-        for k, v in resp["IEconItems"]["570"].items():
-            val = self.parse_generic_field(resp, k, v)
-            if val:
-                item_server_str.append(val)
-
-        coordinator_str = []
-        for k, v in resp["ISteamGameCoordinator"]["570"].items():
-            if k == "stats":
-                embed.add_field(name="Stats", value=self.parse_stat_list(v))
-            else:
-                val = self.parse_generic_field(resp, k, v)
-                if val:
-                    coordinator_str.append(val)
-
-        embed.add_field(
-            name=service_names["IEconItems"],
-            value="\n".join(item_server_str if item_server_str else ["No data"]),
-        )
+        coordinator = resp["ISteamGameCoordinator"]["570"]
+        stats = coordinator.get("stats")
+        if stats is not None:
+            fields.append(("Stats", self.parse_stat_list(stats), True))
 
-        embed.add_field(
-            name=service_names["ISteamGameCoordinator"],
-            value="\n".join(coordinator_str if coordinator_str else ["No data"]),
+        fields.append(
+            (
+                service_names["IEconItems"],
+                self._render_service(resp, resp["IEconItems"]["570"]),
+                True,
+            )
         )
 
-        await ctx.send(embed=embed)
-
-    @commands.command(brief="Gets the Team Fortress 2 API status.")
-    async def tf2(self, ctx):
-        # Format the response.
-        embed = discord.Embed(
-            title="Team Fortress 2 API status",
-            color=steam_color,
-            url="https://steamgaug.es",
+        fields.append(
+            (
+                service_names["ISteamGameCoordinator"],
+                self._render_service(resp, coordinator, skip=("stats",)),
+                True,
+            )
         )
 
-        embed.set_footer(text="Powered by SteamGauges API v2", icon_url=game_icon)
+        return fields
 
-        embed.set_thumbnail(url=game_thumbs["tf2"])
+    def _tf2_fields(self, resp):
+        fields = []
 
-        with ctx.typing():
-            resp = await self.get_status()
-
-        coordinator_str = []
         coordinator = resp["ISteamGameCoordinator"]["440"]
 
-        for k, v in coordinator.items():
-            if k == "schema":
-                continue
-            elif k == "stats":
-                try:
-                    # This may change periodically, so I may have to alter this
-                    war = coordinator[k]["warScore"]
-
-                    war_name = "War: Pyro vs Heavy"
-                    summary = ""
-
-                    for side in war:
-                        name = "Pyro" if side["side"] == 0 else "Heavy"
-                        score = side["score"]["low"]
-                        summary += f"**{name}**: {score:,}\n"
-
-                    embed.add_field(name=war_name, value=summary)
-                except BaseException:
-                    traceback.print_exc()
-                    continue
-            else:
-                val = self.parse_generic_field(resp, k, v)
-                if val:
-                    coordinator_str.append(val)
-
-        if not coordinator_str:
-            coordinator_str = ["No data"]
-
-        embed.add_field(
-            name=service_names["ISteamGameCoordinator"],
-            value="\n".join(coordinator_str),
+        if "stats" in coordinator:
+            try:
+                # This may change periodically, so I may have to alter this
+                war = coordinator["stats"]["warScore"]
+
+                war_name = "War: Pyro vs Heavy"
+                summary = ""
+
+                for side in war:
+                    name = "Pyro" if side["side"] == 0 else "Heavy"
+                    score = side["score"]["low"]
+                    summary += f"**{name}**: {score:,}\n"
+
+                fields.append((war_name, summary, True))
+            except BaseException:
+                traceback.print_exc()
+
+        fields.append(
+            (
+                service_names["ISteamGameCoordinator"],
+                self._render_service(resp, coordinator, skip=("schema", "stats")),
+                True,
+            )
         )
 
         stress_test = resp["ITFSystem_440"]["stress_test"]
         stress_test = "Yes" if stress_test else "No"
 
-        item_server_str = []
-        for k, v in resp["IEconItems"]["440"].items():
-            val = self.parse_generic_field(resp, k, v)
-            if val:
-                item_server_str.append(val)
-
-        if not item_server_str:
-            item_server_str = ["No data"]
-
-        embed.add_field(
-            name=service_names["IEconItems"], value="\n".join(item_server_str)
+        fields.append(
+            (
+                service_names["IEconItems"],
+                self._render_service(resp, resp["IEconItems"]["440"]),
+                True,
+            )
         )
 
-        embed.add_field(name="Currently being stress tested?", value=stress_test)
+        fields.append(("Currently being stress tested?", stress_test, True))
 
-        await ctx.send(embed=embed)
+        return fields
+
+    @staticmethod
+    def _make_embed(title, game):
+        """Makes an embed with the boilerplate every status command shares."""
+        embed = discord.Embed(
+            title=title, color=steam_color, url="https://steamgaug.es"
+        )
+        embed.set_footer(text="Powered by SteamGauges API v2", icon_url=game_icon)
+        embed.set_thumbnail(url=game_thumbs[game])
+        return embed
 
     @staticmethod
     def unrecognised_field(response, field):
@@ -275,22 +281,25 @@ class SteamStatusCog(traits.CogTraits):
 
     def parse_generic_field(self, response, key, value):
         """Tries to make sense of a generic key-value pair."""
-        if key == "time":
-            key = "Latency"
-            value = f"{value}ms"
-        elif key == "online":
-            key = "Status"
-            value = "OK" if value == 1 else "Degraded"
-        elif key == "error":
-            if value is not None and value == "No Error":
+        handler = generic_field_handlers.get(key)
+
+        if handler is not None:
+            field = handler(value)
+            if field is None:
                 return None
+            key, value = field
         elif value is None:
-            value = "No info given!"
-            key = "Error message"
+            key, value = "Error message", "No info given!"
         else:
             return self.unrecognised_field(response, key)
 
-        return f"**{key.title()}**: {value}"
+        return f"**{_pretty(key)}**: {value}"
+
+    def _render_service(self, response, data, skip=()):
+        """Renders the generic fields of a service, one per line."""
+        parse = self.parse_generic_field
+        lines = [parse(response, k, v) for k, v in data.items() if k not in skip]
+        return "\n".join(line for line in lines if line) or "No data"
 
     @staticmethod
     def parse_stat_list(stat_dict):
@@ -301,17 +310,25 @@ class SteamStatusCog(traits.CogTraits):
                 continue
             elif isinstance(stat_v, (float, int)):
                 stat_v = f"{stat_v:,}"
-            stats.append(f'**{stat_k.replace("_", " ").title()}**: {stat_v}')
+            stats.append(f"**{_pretty(stat_k)}**: {stat_v}")
 
         return "\n".join(stats if stats else ["No stats"])
 
     async def get_status(self):
-        """Gets a dict of the status information."""
-        conn = await self.acquire_http()
-        response = await conn.request("GET", api_endpoint)
-        obj = await response.json()
-        assert isinstance(obj, dict)
-        return obj
+        """
+        Gets a dict of the status information. This is cached for
+        `status_ttl` seconds, and concurrent callers share one request.
+        """
+        async with self._status_lock:
+            now = time.monotonic()
+            if self._status_time is None or now - self._status_time > self.status_ttl:
+                conn = await self.acquire_http()
+                async with conn.get(api_endpoint) as response:
+                    self._status = orjson.loads(await response.read())
+                self._status_time = now
+                self._fields = {}
+
+            return self._status
 
 
 def setup(bot):
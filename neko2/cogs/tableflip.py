@@ -29,12 +29,14 @@ LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import asyncio
+import collections
 import random
 
 import discord
 
 from discomaton.factories import bookbinding
-from neko2.shared import alg, commands, traits
+from neko2.shared import commands, traits
 
 
 class TableFlipCog(traits.CogTraits):
@@ -48,6 +50,14 @@ class TableFlipCog(traits.CogTraits):
 
     webhook_avatar_res = 64
 
+    # Most avatars to keep the image data cached for.
+    avatar_cache_size = 512
+
+    # Maps (user ID, avatar hash) to the avatar image data. The avatar hash
+    # changes with the avatar, so entries never go stale. Least recently used
+    # entries are evicted first.
+    _avatar_cache = collections.OrderedDict()
+
     binds = {
         "/shrug": "¯\\\_(ツ)\_/¯",
         "/tableflip": ("(╯°□°）╯︵ ┻━┻", "(ノಠ益ಠ)ノ︵ ┻━┻"),
@@ -84,16 +94,34 @@ class TableFlipCog(traits.CogTraits):
             )
 
     @classmethod
-    async def delete_and_copy_handle_with_webhook(cls, message):
-        http = await cls.acquire_http()
+    async def get_avatar(cls, author: discord.User) -> bytes:
+        """Gets the avatar image data to give a webhook impersonating the user."""
+        key = (author.id, author.avatar)
+        avatar = cls._avatar_cache.get(key)
 
-        channel: discord.TextChannel = message.channel
-        author: discord.User = message.author
+        if avatar is not None:
+            cls._avatar_cache.move_to_end(key)
+            return avatar
+
+        http = await cls.acquire_http()
 
         # Use bit inception to get the avatar.
         avatar_url = author.avatar_url_as(format="png", size=cls.webhook_avatar_res)
 
-        avatar_resp = await http.get(avatar_url)
+        async with http.get(str(avatar_url)) as avatar_resp:
+            avatar = await avatar_resp.read()
+
+        cls._avatar_cache[key] = avatar
+        while len(cls._avatar_cache) > cls.avatar_cache_size:
+            cls._avatar_cache.popitem(last=False)
+
+        return avatar
+
+    @classmethod
+    async def delete_and_copy_handle_with_webhook(cls, message):
+        channel: discord.TextChannel = message.channel
+
+        avatar = await cls.get_avatar(message.author)
 
         name = message.author.display_name
         if len(name) < 2:
@@ -101,16 +129,16 @@ class TableFlipCog(traits.CogTraits):
             name = str(message.author)
 
         # noinspection PyUnresolvedReferences
-        wh: discord.Webhook = await channel.create_webhook(
-            name=name, avatar=await avatar_resp.read()
-        )
+        wh: discord.Webhook = await channel.create_webhook(name=name, avatar=avatar)
 
         try:
-            await message.delete()
-        except:
-            pass
+            # Delete the original at the same time as we resend it. As when
+            # these ran one after the other, the original is gone if the
+            # resend fails.
+            await asyncio.gather(
+                commands.try_delete(message), wh.send(content=message.content)
+            )
         finally:
-            await wh.send(content=message.content)
             await wh.delete()
 
     @classmethod
@@ -123,27 +151,25 @@ class TableFlipCog(traits.CogTraits):
         author = message.author
         content = message.content
 
-        # Cases where we should refuse to run.
-        if message.guild is None:
-            return
-        if not message.guild.me.guild_permissions.manage_webhooks:
+        # Cases where we should refuse to run. This runs for every message we
+        # can see, so do the cheapest checks first. Every bind starts with a
+        # slash, which rules out nearly all messages straight away.
+        if not content or content[0] != "/":
             return
         elif author.bot:
             return
+        elif message.guild is None:
+            return
+        elif not message.guild.me.guild_permissions.manage_webhooks:
+            return
 
-        def pred(bind):
-            """Matches the use of a Discord bind."""
-            bind_whitespace = (f"{bind}\n", f"{bind} ")
-            return content == bind or any(
-                content.startswith(b) for b in bind_whitespace
-            )
-
-        bind = alg.find(pred, cls.binds)
+        # A bind must be the whole first word, which ends at the first space
+        # or newline. No bind contains either, so one dict lookup finds it.
+        bind = content.partition(" ")[0].partition("\n")[0]
+        bind_result = cls.binds.get(bind)
 
-        if not bind:
+        if bind_result is None:
             return
-
-        bind_result = cls.binds[bind]
         if isinstance(bind_result, tuple):
             bind_result = random.choice(bind_result)
 
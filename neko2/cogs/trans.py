@@ -28,13 +28,58 @@ LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import concurrent.futures
+import functools
+import threading
 
 import googletrans
 from discomaton.factories import bookbinding
 from neko2.shared import traits, commands, fuzzy
 
+# Language codes we can pass straight to Google without any fuzzy matching.
+acceptable_langs = frozenset((*googletrans.LANGUAGES.keys(), "auto"))
+
+# Rendered once, as the language list never changes at runtime.
+lang_lines = tuple(
+    f"`{code}` - {lang.title()}" for code, lang in sorted(googletrans.LANGUAGES.items())
+)
+
+
+@functools.lru_cache(maxsize=256)
+def fuzzy_wuzzy_match(input_name):
+    """Gets the code of the language whose name best matches the input."""
+    match = fuzzy.extract_best(input_name, googletrans.LANGUAGES.values())
+    if match is None:
+        raise NameError("Not a recognised language")
+    else:
+        return googletrans.LANGCODES[match[0]]
+
 
 class TransCog(traits.CogTraits):
+    # Most translations to run at once. Each one blocks a thread on HTTP, so
+    # they get their own pool rather than starving the shared IO pool.
+    max_concurrent_translations = 4
+
+    def __init__(self):
+        # Translators aren't thread safe, so each worker thread gets its own,
+        # made the first time that thread translates something.
+        self._local = threading.local()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrent_translations,
+            thread_name_prefix="trans",
+        )
+
+    def __unload(self):
+        self._executor.shutdown(wait=False)
+
+    def _get_translator(self):
+        """Gets the translator belonging to the calling thread."""
+        try:
+            return self._local.translator
+        except AttributeError:
+            translator = self._local.translator = googletrans.Translator()
+            return translator
+
     @commands.group(
         brief="Translate between languages.",
         aliases=["trans", "t"],
@@ -60,16 +105,7 @@ class TransCog(traits.CogTraits):
         if dest_lang in ("*", "."):
             dest_lang = "en"
 
-        def fuzzy_wuzzy_match(input_name):
-            match = fuzzy.extract_best(input_name, googletrans.LANGUAGES.values())
-            if match is None:
-                raise NameError("Not a recognised language")
-            else:
-                return googletrans.LANGCODES[match[0]]
-
         try:
-            acceptable_langs = (*googletrans.LANGUAGES.keys(), "auto")
-
             source_lang = source_lang.lower()
             dest_lang = dest_lang.lower()
             if source_lang not in acceptable_langs:
@@ -78,11 +114,9 @@ class TransCog(traits.CogTraits):
                 dest_lang = fuzzy_wuzzy_match(dest_lang)
 
             def pool():
-                return googletrans.Translator().translate(
-                    phrase, dest_lang, source_lang
-                )
+                return self._get_translator().translate(phrase, dest_lang, source_lang)
 
-            result = await self.run_in_io_executor(pool)
+            result = await ctx.bot.loop.run_in_executor(self._executor, pool)
 
             if result is None:
                 await ctx.send("No response...", delete_after=10)
@@ -107,12 +141,8 @@ class TransCog(traits.CogTraits):
 
     @translate.command(brief="View a list of supported languages")
     async def list(self, ctx):
-        langs = [
-            f"`{code}` - {lang.title()}" for code, lang in googletrans.LANGUAGES.items()
-        ]
-
         book = bookbinding.StringBookBinder(ctx)
-        for line in langs:
+        for line in lang_lines:
             book.add_line(line)
 
         await book.start()
@@ -128,14 +158,14 @@ class TransCog(traits.CogTraits):
         I will assume you want English: the best language of them all 😉
         """
         # Get the previous message.
-        history = await ctx.channel.history(limit=2).flatten()
+        previous = None
+        async for previous in ctx.channel.history(limit=1, before=ctx.message):
+            break
 
-        if len(history) < 2 or not history[-1].content:
+        if previous is None or not previous.content:
             await ctx.send("I can't seem to find a message...", delete_after=10)
         else:
-            await self.translate.callback(
-                self, ctx, "*", to, phrase=history[-1].content
-            )
+            await self.translate.callback(self, ctx, "*", to, phrase=previous.content)
 
 
 def setup(bot):
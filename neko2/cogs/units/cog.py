@@ -120,15 +120,14 @@ class UnitCog(traits.CogTraits):
         equivalents = collections.OrderedDict()
 
         for quantity in quantities:
+            category = conversions.get_category(quantity.unit.unit_type)
             compatible = conversions.get_compatible_models(
                 quantity.unit, ignore_self=True
             )
 
-            # Convert to SI first.
-            si = quantity.unit.to_si(quantity.value)
-
             this_equivalents = tuple(
-                models.ValueModel(c.from_si(si), c) for c in compatible
+                models.ValueModel(category.convert(quantity.value, quantity.unit, c), c)
+                for c in compatible
             )
 
             equivalents[quantity] = this_equivalents
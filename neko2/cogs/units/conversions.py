@@ -233,9 +233,7 @@ def find_unit_by_str(input_string: str) -> Optional[UnitModel]:
     Attempts to find a match for the given input string. Returns None if
     nothing is resolved.
     """
-    input_string = input_string.lower()
-
     for category in _models:
-        for model in category:
-            if input_string in (n.lower() for n in model.names):
-                return model
+        model = category.find_unit(input_string)
+        if model is not None:
+            return model
@@ -30,12 +30,11 @@ WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 from decimal import Decimal
 import enum
+import functools
 import typing
 
 from dataclasses import dataclass
 
-from neko2.shared import alg
-
 __all__ = (
     "UnitCategoryModel",
     "UnitModel",
@@ -85,6 +84,9 @@ class UnitModel:
             code formatting a string from this unit should not use standard
             form
             and instead prefer kilo/mega/giga prefixes, etc.
+    :param si_per_this: how many SI units one of this unit is, if the unit is
+            purely a multiple of the SI quantity. None otherwise, in which case
+            conversions go through `to_si` and `from_si`.
     """
 
     # What 1 si of whatever this unit measures is in this specific unit.
@@ -97,8 +99,13 @@ class UnitModel:
         is_si: bool = False,
         exclude_from_conversions=False,
         never_use_std_form=False,
+        si_per_this: typing.Optional[Decimal] = None,
     ):
         self.names = (name, *other_names)
+        # Names never change, so work these out once rather than per compare.
+        self._lower_names = tuple(n.lower() for n in self.names)
+        self._hash = hash(self._lower_names[0])
+        self.si_per_this = si_per_this
         self._to_si = to_si
         self._from_si = from_si
         self.is_si = is_si
@@ -123,11 +130,11 @@ class UnitModel:
         if isinstance(other, UnitModel):
             return super().__eq__(other)
         else:
-            return other.lower() in (n.lower() for n in self.names)
+            return other.lower() in self._lower_names
 
     def __hash__(self):
         """Enables hashing by the unit's primary name."""
-        return hash(self.name.lower())
+        return self._hash
 
     def __str__(self):
         return self.name
@@ -172,6 +179,7 @@ class UnitModel:
             *other_names,
             exclude_from_conversions=exclude_from_conversions,
             never_use_std_form=never_use_std_form,
+            si_per_this=si_per_this,
         )
 
     @classmethod
@@ -191,6 +199,7 @@ class UnitModel:
             *other_names,
             is_si=True,
             never_use_std_form=never_use_std_form,
+            si_per_this=Decimal(1),
         )
 
 
@@ -204,17 +213,24 @@ class UnitCollectionModel:
         self.si.is_si = True
         self.conversions = (si, *other_conversions)
 
+        # Maps each lowercase name to the first unit that has it.
+        self._by_name = {}
+
         for conversion in self.conversions:
             # noinspection PyProtectedMember
             conversion._set_unit_category(self.unit_type)
 
+            # noinspection PyProtectedMember
+            for name in conversion._lower_names:
+                self._by_name.setdefault(name, conversion)
+
     def find_unit(self, name: str) -> typing.Optional[UnitModel]:
         """
         Looks for a unit with a matching name, and returns it.
 
         If one does not exist, we return None.
         """
-        return alg.find(lambda c: c == name, self.conversions)
+        return self._by_name.get(name.lower())
 
     def __contains__(self, unit: str):
         """
@@ -222,7 +238,7 @@ class UnitCollectionModel:
         :param unit: string to look up.
         :return: true if we can, false otherwise.
         """
-        return bool(self.find_unit(unit))
+        return unit.lower() in self._by_name
 
     @staticmethod
     def convert(qty: Decimal, unit: UnitModel, to: UnitModel):
@@ -230,10 +246,13 @@ class UnitCollectionModel:
         Converts one quantity to another assuming they are the same
         type of unit.
         """
-        if unit == to:
+        if unit is to:
             return qty
+        elif unit.si_per_this is not None and to.si_per_this is not None:
+            # Linear units can skip calling both conversion closures.
+            return qty * unit.si_per_this / to.si_per_this
         else:
-            return Decimal("1")
+            return to.from_si(unit.to_si(qty))
 
     def find_conversions(self, qty: Decimal, unit: UnitModel):
         """
@@ -319,6 +338,24 @@ bases = {
     +24: ("Y", "yotta"),
 }
 
+# Largest first, so that a tie between two bases goes to the larger one.
+_base_pots = sorted(bases, reverse=True)
+
+# Each power of ten in `bases` as an exact decimal.
+_pow10 = {pot: Decimal(10) ** pot for pot in bases}
+
+# Values in this range are not written in standard form.
+_std_form_min = Decimal("0.00001")
+_std_form_max = Decimal("1000000000")
+
+_zero = Decimal(0)
+
+
+@functools.lru_cache(maxsize=128)
+def _nearest_base(real_pot: int) -> int:
+    """Gets the power of ten in `bases` closest to the given one."""
+    return min(_base_pots, key=lambda c: abs(real_pot - c))
+
 
 def pretty_print(
     d: Decimal,
@@ -359,23 +396,13 @@ def pretty_print(
     else:
         real_pot = 0
 
-    if real_pot in bases:
-        suffix = bases[real_pot]
-        chosen_pot = real_pot
-    else:
-        # Find the closest logarithm.
-        choices = bases.keys()
-
-        differences = {abs(real_pot - c): c for c in choices}
-        sorted_choices = sorted(differences.keys())
-
-        chosen_pot = differences[sorted_choices[0]]
-        suffix = bases[chosen_pot]
+    chosen_pot = _nearest_base(real_pot)
+    suffix = bases[chosen_pot]
 
     # Divide by the chosen power of ten to get the
     # value in the base we want.
     if use_std_form:
-        if Decimal("0.00001") <= abs(d) < Decimal("1000000000") or d.is_zero():
+        if _std_form_min <= abs(d) < _std_form_max or d.is_zero():
             rounded_str = f"{d:,.6f}"
             return f"{trunc(rounded_str)} {suffix_name}"
             # return f'{d:,.4f} {suffix_name}'
@@ -383,11 +410,11 @@ def pretty_print(
             return f"{d:,.4e} {suffix_name}"
             # return f'{d:,.4g} {suffix_name}'
     else:
-        d /= Decimal(10 ** chosen_pot)
+        d /= _pow10[chosen_pot]
 
         rounded = round(d, 3)
 
-        if rounded == Decimal(0) and none_if_rounds_to_zero:
+        if rounded == _zero and none_if_rounds_to_zero:
             return None
         else:
             rounded_str = f"{rounded:,f}"
@@ -126,10 +126,10 @@ class XkcdCache(threading.Thread, scribe.Scribe, metaclass=morefunctools.Singlet
                     try:
                         next_comic = sesh.get(get_xkcd(i)).json()
                     except:
-                        self.logger.warning(f"Could not get xkcd no. {i}")
+                        self.logger.warning("Could not get xkcd no. %s", i)
                         continue
                     else:
-                        self.logger.debug(f"Cached xkcd no. {i}")
+                        self.logger.debug("Cached xkcd no. %s", i)
 
                     data.append(
                         {
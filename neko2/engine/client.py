@@ -234,7 +234,7 @@ class Bot(commands.Bot, scribe.Scribe):
         not load properly. This attempts to fix this.
         """
         try:
-            self.logger.info(f"Loading cog {type(cog).__name__!r}")
+            self.logger.info("Loading cog %r", type(cog).__name__)
 
             super().add_cog(cog)
             self.dispatch("add_cog", cog)
@@ -246,7 +246,7 @@ class Bot(commands.Bot, scribe.Scribe):
 
     def remove_cog(self, name):
         """Logs and removes a cog."""
-        self.logger.info(f"Removing cog {name!r}")
+        self.logger.info("Removing cog %r", name)
         # Find the cog.
         cog = self.get_cog(name)
         super().remove_cog(name)
@@ -254,13 +254,13 @@ class Bot(commands.Bot, scribe.Scribe):
 
     def add_command(self, command):
         """Logs and adds a command."""
-        self.logger.info(f"Adding command {str(command)!r}")
+        self.logger.info("Adding command %r", str(command))
         super().add_command(command)
         self.dispatch("add_command", command)
 
     def remove_command(self, name):
         """Logs and removes an existing command."""
-        self.logger.info(f"Removing command {name!r}")
+        self.logger.info("Removing command %r", name)
         # Find the command
         command = self.get_command(name)
         super().remove_command(name)
@@ -274,7 +274,7 @@ class Bot(commands.Bot, scribe.Scribe):
         :param name: the extension to load.
         :return: the extension that has been loaded.
         """
-        self.logger.info(f"Loading extension {name!r}")
+        self.logger.info("Loading extension %r", name)
         super().load_extension(name)
         extension = self.extensions[name]
         self.dispatch("load_extension", extension)
@@ -282,7 +282,7 @@ class Bot(commands.Bot, scribe.Scribe):
 
     def unload_extension(self, name):
         """Logs and unloads the given extension."""
-        self.logger.info(f"Unloading extension {name!r}")
+        self.logger.info("Unloading extension %r", name)
         super().unload_extension(name)
 
     # noinspection PyBroadException
@@ -49,11 +49,11 @@ class OrderedSet(Set, typing.Generic[SetType]):
         """Initialise the set."""
 
         # This implementation is just a dictionary that only utilises the keys.
-        # We use the OrderedDict implementation underneath.
-        if iterable:
-            self._dict = OrderedDict({k: None for k in iterable})
-        else:
-            self._dict = OrderedDict()
+        # Plain dicts keep insertion order, so we don't need an OrderedDict.
+        self._dict = dict.fromkeys(iterable) if iterable else {}
+
+        # The keys again, in order, so that indexing doesn't have to copy them.
+        self._list = list(self._dict)
 
     def __contains__(self, x: SetType) -> bool:
         """Return true if the given object is present in the set."""
@@ -69,7 +69,7 @@ class OrderedSet(Set, typing.Generic[SetType]):
 
     def __getitem__(self, index: int) -> SetType:
         """Access the element at the given index in the set."""
-        return list(self._dict.keys())[index]
+        return self._list[index]
 
     def __str__(self) -> str:
         """Get the string representation of the set."""
@@ -84,11 +84,15 @@ class MutableOrderedSet(OrderedSet, MutableSet):
 
     def add(self, x: SetType) -> None:
         """Adds a new element to the set."""
-        self._dict[x] = None
+        if x not in self._dict:
+            self._dict[x] = None
+            self._list.append(x)
 
     def discard(self, x: SetType) -> None:
-        """Removes an element from the set."""
-        self._dict.pop(x)
+        """Removes an element from the set, if it is present."""
+        if x in self._dict:
+            del self._dict[x]
+            self._list.remove(x)
 
 
 FifoFiloType = typing.TypeVar("FifoFiloType")
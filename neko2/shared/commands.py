@@ -35,7 +35,12 @@ WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 import asyncio
 import typing  # Type checking
 
-import cached_property  # Caching properties
+try:
+    # Python 3.8 and newer.
+    from functools import cached_property  # Caching properties
+except ImportError:
+    from cached_property import cached_property
+
 import discord  # Message type.
 from discord.ext import commands as discord_commands
 
@@ -71,27 +76,26 @@ class CommandMixin:
     usage: property
     clean_params: property
     examples: list
+    names: typing.FrozenSet[str]
 
     def __init__(self, *args, **kwargs):
         self.examples = kwargs.pop("examples", [])
+        # The name and aliases are set by Discord.py's constructor, which has
+        # already run, and never change after that.
+        self.names = frozenset((self.name, *self.aliases))
 
-    @cached_property.cached_property
-    def names(self) -> typing.FrozenSet[str]:
-        """Gets all command names."""
-        return frozenset({self.name, *self.aliases})
-
-    @cached_property.cached_property
+    @cached_property
     def qualified_aliases(self) -> typing.FrozenSet[str]:
         """Gets all qualified aliases."""
         parent_fqcn = self.full_parent_name
         if parent_fqcn:
             parent_fqcn += " "
-        return frozenset({parent_fqcn + alias for alias in self.aliases})
+        return frozenset(parent_fqcn + alias for alias in self.aliases)
 
-    @cached_property.cached_property
+    @cached_property
     def qualified_names(self) -> typing.FrozenSet[str]:
         """Gets all qualified names."""
-        return frozenset({self.qualified_name, *self.qualified_aliases})
+        return frozenset((self.qualified_name, *self.qualified_aliases))
 
 
 class Command(discord_commands.Command, CommandMixin):
@@ -61,8 +61,11 @@ def _magic_number(*, cpu_bound=False):
     # OR with 1 to ensure at least 1 "node" is detected.
     if cpu_bound:
         return 2 * (os.cpu_count() or 1)
-    else:
+    elif hasattr(os, "sched_getaffinity"):
         return 3 * (len(os.sched_getaffinity(0)) or 1)
+    else:
+        # Not every platform can tell us the affinity (e.g. macOS, Windows).
+        return 3 * (os.cpu_count() or 1)
 
 
 class CogTraits(scribe.Scribe):
@@ -79,8 +82,22 @@ class CogTraits(scribe.Scribe):
         cls.__io_pool = concurrent.futures.ThreadPoolExecutor(
             _magic_number(cpu_bound=False)
         )
+        cls.__http_pool = cls.__make_http_pool(loop)
+
+    @classmethod
+    def __make_http_pool(cls, loop):
         cls.logger.info("Initialising HTTP session.")
-        cls.__http_pool = aiohttp.ClientSession(loop=loop)
+        # One pooled connector shared by every cog, so that repeated requests
+        # to the same host reuse keep-alive connections rather than paying for
+        # a new TCP/TLS handshake each time.
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            loop=loop,
+        )
+        return aiohttp.ClientSession(connector=connector, loop=loop)
 
     @classmethod
     async def _dealloc(cls):
@@ -92,12 +109,18 @@ class CogTraits(scribe.Scribe):
                 cls.__io_pool.shutdown(wait=True)
 
     @classmethod
-    async def acquire_http(cls):
+    async def acquire_http(cls) -> aiohttp.ClientSession:
         """
         Acquires the shared global session.
         Should not be closed after use.
         """
-        return cls.__http_pool
+        # Store it on CogTraits itself, not whichever subclass called us, so
+        # every cog shares the one session that _dealloc closes. Nothing is
+        # awaited between the check and the assignment, so concurrent callers
+        # can't both end up making a session.
+        if CogTraits.__http_pool is None:
+            CogTraits.__http_pool = cls.__make_http_pool(CogTraits.__loop)
+        return CogTraits.__http_pool
 
     @classmethod
     async def acquire_http_session(cls, loop=None):
@@ -126,11 +149,9 @@ class CogTraits(scribe.Scribe):
         if not loop:
             loop = cls.__loop
 
-        if not args:
-            args = []
-        if not kwargs:
-            kwargs = {}
+        # The executor takes positional arguments itself, so we only need a
+        # partial when there are keyword arguments to bind.
+        if kwargs:
+            call = functools.partial(call, **kwargs)
 
-        return await loop.run_in_executor(
-            cls.__io_pool, functools.partial(call, *args, **kwargs)
-        )
+        return await loop.run_in_executor(cls.__io_pool, call, *(args or ()))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Tests the paginator splits input into pages as expected.
+
+===
+
+MIT License
+
+Copyright (c) 2018 Neko404NotFound
+
+Permission is hereby granted, free of charge, to any person obtaining
+a copy of this software and associated documentation files (the
+"Software"), to deal in the Software without restriction, including
+without limitation the rights to use, copy, modify, merge, publish,
+distribute, sublicense, and/or sell copies of the Software, and to
+permit persons to whom the Software is furnished to do so, subject to
+the following conditions:
+
+The above copyright notice and this permission notice shall be
+included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+
+from discomaton.util.pag import *
+
+
+class TestPaginator(unittest.TestCase):
+    def setUp(self):
+        """Initialise a large multi-line input, like the output of help()."""
+        self.text = "".join(
+            f"line {i}:{' word' * (i % 17)}{'  ' * (i % 3)}\n" for i in range(5000)
+        )
+
+    def paginate(self, *bits, **kwargs):
+        pag = Paginator(**kwargs)
+        for bit in bits:
+            pag.add(bit)
+        return pag.pages
+
+    def test_whole_buffer_matches_lines(self):
+        """Tests adding one large string gives the same pages as line by line"""
+        for kwargs in (
+            {},
+            {"max_lines": None, "prefix": "```", "suffix": "```"},
+            {"max_chars": 50, "max_lines": 3},
+        ):
+            self.assertEqual(
+                self.paginate(*self.text.splitlines(keepends=True), **kwargs),
+                self.paginate(self.text, **kwargs),
+            )
+
+    def test_spaces_kept(self):
+        """Tests splitting on spaces loses none of them"""
+        for text in ("a b", " a  b ", "no-spaces", "   "):
+            pages = self.paginate(text, max_lines=None)
+            self.assertEqual((f"\n{text}\n",), pages)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Tests the stack keeps track of what it holds.
+
+===
+
+MIT License
+
+Copyright (c) 2018 Neko404NotFound
+
+Permission is hereby granted, free of charge, to any person obtaining
+a copy of this software and associated documentation files (the
+"Software"), to deal in the Software without restriction, including
+without limitation the rights to use, copy, modify, merge, publish,
+distribute, sublicense, and/or sell copies of the Software, and to
+permit persons to whom the Software is furnished to do so, subject to
+the following conditions:
+
+The above copyright notice and this permission notice shall be
+included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+
+from discomaton.util.stack import *
+
+
+class TestStack(unittest.TestCase):
+    def test_duplicates(self):
+        """Tests an item stays in the stack until every copy is popped"""
+        stack = Stack([1, 2, 2])
+        self.assertIn(2, stack)
+        self.assertEqual(2, stack.pop())
+        self.assertIn(2, stack)
+        self.assertEqual(2, stack.pop())
+        self.assertNotIn(2, stack)
+        self.assertIn(1, stack)
+
+    def test_pop_to_empty(self):
+        """Tests nothing is left in the stack once it is all popped"""
+        stack = Stack()
+        for item in ("a", "b", "a"):
+            stack.push(item)
+        while stack:
+            stack.pop()
+        self.assertNotIn("a", stack)
+        self.assertNotIn("b", stack)
+        self.assertEqual({}, stack._counts)
+
+    def test_setitem(self):
+        """Tests replacing an item forgets the old one and tracks the new one"""
+        stack = Stack([1, 2, 3])
+        stack[1] = 4
+        self.assertNotIn(2, stack)
+        self.assertIn(4, stack)
+        self.assertEqual([1, 4, 3], list(stack))
+
+    def test_setitem_slice(self):
+        """Tests replacing a slice keeps membership in step"""
+        stack = Stack([1, 2, 3, 4])
+        stack[1:3] = ["x", ["y"], "z"]
+        self.assertEqual([1, "x", ["y"], "z", 4], list(stack))
+        self.assertNotIn(2, stack)
+        self.assertNotIn(3, stack)
+        self.assertIn("z", stack)
+        self.assertIn(["y"], stack)
+        self.assertEqual(1, stack._unhashable)
+
+    def test_bad_setitem(self):
+        """Tests a failed assignment leaves membership alone"""
+        stack = Stack([1, 2, 3])
+        with self.assertRaises(IndexError):
+            stack[5] = 4
+        with self.assertRaises(ValueError):
+            stack[::2] = [9]
+        self.assertEqual([1, 2, 3], list(stack))
+        self.assertIn(1, stack)
+        self.assertNotIn(4, stack)
+        self.assertNotIn(9, stack)
+        self.assertEqual(0, stack._unhashable)
+
+    def test_unhashable(self):
+        """Tests membership with a mix of hashable and unhashable items"""
+        stack = Stack([1, [2], {"a": 3}])
+        self.assertIn(1, stack)
+        self.assertIn([2], stack)
+        self.assertIn({"a": 3}, stack)
+        self.assertNotIn([3], stack)
+        self.assertNotIn(2, stack)
+
+        stack.pop()
+        stack.pop()
+        self.assertEqual(0, stack._unhashable)
+        self.assertNotIn([2], stack)
+        self.assertIn(1, stack)
+
+    def test_flip(self):
+        """Tests flipping reverses the stack without changing what is in it"""
+        stack = Stack([1, 2, 3])
+        stack.flip()
+        self.assertEqual([3, 2, 1], list(stack))
+        self.assertEqual(1, stack.pop())
+        self.assertNotIn(1, stack)
+        self.assertIn(3, stack)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Tests searching the PyPI project index.
+
+===
+
+MIT License
+
+Copyright (c) 2018 Neko404NotFound
+
+Permission is hereby granted, free of charge, to any person obtaining
+a copy of this software and associated documentation files (the
+"Software"), to deal in the Software without restriction, including
+without limitation the rights to use, copy, modify, merge, publish,
+distribute, sublicense, and/or sell copies of the Software, and to
+permit persons to whom the Software is furnished to do so, subject to
+the following conditions:
+
+The above copyright notice and this permission notice shall be
+included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import json
+import unittest
+
+from neko2.cogs.py import PyCog, search_names
+
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        """Initialise an index from display names, like PyPI gives us."""
+        projects = (
+            "zope.interface",
+            "Zope.Event",
+            "ruamel.yaml",
+            "ruamel-yaml-conda",
+            "typing_extensions",
+            "typer",
+            "Flask",
+        )
+        raw = json.dumps({"projects": [{"name": name} for name in projects]})
+        self.index = PyCog._parse_simple_index(raw.encode())
+
+    def test_index_normalised(self):
+        """Tests the parsed index is sorted and PEP 503 normalised"""
+        self.assertEqual(sorted(self.index), self.index)
+        self.assertIn("zope-interface", self.index)
+        self.assertIn("ruamel-yaml", self.index)
+        self.assertIn("typing-extensions", self.index)
+        self.assertIn("flask", self.index)
+
+    def test_dotted_and_underscored_queries(self):
+        """Tests queries match however their separators are written"""
+        for query in ("zope.interface", "zope_interface", "Zope-Interface"):
+            self.assertEqual(["zope-interface"], search_names(self.index, query, 50))
+
+        self.assertEqual(
+            ["ruamel-yaml", "ruamel-yaml-conda"],
+            search_names(self.index, "ruamel.yaml", 50),
+        )
+        self.assertEqual(
+            ["typing-extensions"], search_names(self.index, "typing_extensions", 50)
+        )
+
+    def test_substring_fallback(self):
+        """Tests names containing the query are found if none start with it"""
+        self.assertEqual(["typing-extensions"], search_names(self.index, "ing_ext", 50))
+        self.assertEqual([], search_names(self.index, "nothing", 50))
+
+    def test_limit(self):
+        """Tests no more results are returned than asked for"""
+        self.assertEqual(["zope-event"], search_names(self.index, "zope", 1))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Tests the unit models and conversions between them.
+
+===
+
+MIT License
+
+Copyright (c) 2018 Neko404NotFound
+
+Permission is hereby granted, free of charge, to any person obtaining
+a copy of this software and associated documentation files (the
+"Software"), to deal in the Software without restriction, including
+without limitation the rights to use, copy, modify, merge, publish,
+distribute, sublicense, and/or sell copies of the Software, and to
+permit persons to whom the Software is furnished to do so, subject to
+the following conditions:
+
+The above copyright notice and this permission notice shall be
+included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import decimal
+import unittest
+
+from neko2.cogs.units.conversions import *
+from neko2.cogs.units.models import *
+
+d = decimal.Decimal
+
+
+class TestModels(unittest.TestCase):
+    def test_convert_linear(self):
+        """Tests converting between units that are multiples of SI"""
+        km = find_unit_by_str("km")
+        ft = find_unit_by_str("ft")
+        distance = get_category(UnitCategoryModel.DISTANCE)
+
+        self.assertEqual(d("1"), distance.convert(d("1"), km, km))
+        self.assertEqual(d("1000"), distance.convert(d("1"), km, distance.si))
+        self.assertEqual(
+            ft.from_si(km.to_si(d("2.5"))), distance.convert(d("2.5"), km, ft)
+        )
+
+    def test_convert_non_linear(self):
+        """Tests converting between temperatures, which are not multiples"""
+        celsius = find_unit_by_str("celsius")
+        fahrenheit = find_unit_by_str("fahrenheit")
+        temperature = get_category(UnitCategoryModel.TEMPERATURE)
+
+        self.assertEqual(d("212"), temperature.convert(d("100"), celsius, fahrenheit))
+        self.assertEqual(
+            d("373.15"), temperature.convert(d("100"), celsius, temperature.si)
+        )
+
+    def test_find_conversions(self):
+        """Tests every other unit in the collection is converted to"""
+        time = get_category(UnitCategoryModel.TIME)
+        hour = find_unit_by_str("hours")
+
+        results = time.find_conversions(d("2"), hour)
+
+        self.assertEqual(len(time.conversions) - 1, len(results))
+        self.assertIn(d("7200"), results)
+        self.assertIn(d("120"), results)
+
+    def test_pretty_print_prefixes(self):
+        """Tests the closest SI prefix is picked when not in standard form"""
+        for value, output in (
+            (d("1500"), "1.5 km"),
+            (d("0.0025"), "0.25 cm"),
+            (d("12"), "12 m"),
+            (d("0.5"), "0.5 m"),
+        ):
+            self.assertEqual(output, pretty_print(value, "m", use_std_form=False))
+
+    def test_find_unit(self):
+        """Tests units are found by any of their names, ignoring case"""
+        distance = get_category(UnitCategoryModel.DISTANCE)
+        feet = distance.find_unit("feet")
+
+        self.assertIs(feet, distance.find_unit("FT"))
+        self.assertIs(feet, find_unit_by_str("Foot"))
+        self.assertIn("Feet", distance)
+        self.assertNotIn("seconds", distance)
+        self.assertIsNone(distance.find_unit("seconds"))
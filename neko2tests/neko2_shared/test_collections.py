@@ -0,0 +1,85 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Tests the ordered sets keep their order and contents in step.
+
+===
+
+MIT License
+
+Copyright (c) 2018 Neko404NotFound
+
+Permission is hereby granted, free of charge, to any person obtaining
+a copy of this software and associated documentation files (the
+"Software"), to deal in the Software without restriction, including
+without limitation the rights to use, copy, modify, merge, publish,
+distribute, sublicense, and/or sell copies of the Software, and to
+permit persons to whom the Software is furnished to do so, subject to
+the following conditions:
+
+The above copyright notice and this permission notice shall be
+included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+
+from neko2.shared.collections import *
+
+
+class TestOrderedSet(unittest.TestCase):
+    def test_init(self):
+        """Tests duplicates are dropped and the first occurrence kept"""
+        s = OrderedSet([3, 1, 3, 2, 1])
+        self.assertEqual([3, 1, 2], list(s))
+        self.assertEqual(3, len(s))
+        self.assertEqual(0, len(OrderedSet()))
+
+    def test_getitem(self):
+        """Tests indexing follows insertion order"""
+        s = OrderedSet("cab")
+        self.assertEqual(["c", "a", "b"], [s[i] for i in range(len(s))])
+        self.assertEqual("b", s[-1])
+        self.assertEqual(["a", "b"], s[1:])
+        with self.assertRaises(IndexError):
+            s[3]
+
+    def test_add(self):
+        """Tests adding only appends items not already in the set"""
+        s = MutableOrderedSet([1, 2])
+        s.add(2)
+        s.add(3)
+        s.add(1)
+        self.assertEqual([1, 2, 3], list(s))
+        self.assertEqual([1, 2, 3], [s[i] for i in range(len(s))])
+
+    def test_discard(self):
+        """Tests discarding removes the item from the order as well"""
+        s = MutableOrderedSet([1, 2, 3])
+        s.discard(2)
+        self.assertNotIn(2, s)
+        self.assertEqual([1, 3], [s[i] for i in range(len(s))])
+
+        s.add(2)
+        self.assertEqual(2, s[-1])
+        self.assertEqual([1, 3, 2], list(s))
+
+    def test_discard_missing(self):
+        """Tests discarding a missing item changes nothing"""
+        s = MutableOrderedSet([1, 2])
+        s.discard(5)
+        self.assertEqual([1, 2], [s[i] for i in range(len(s))])
+
+    def test_remove_missing(self):
+        """Tests removing a missing item raises like any other set"""
+        s = MutableOrderedSet([1, 2])
+        with self.assertRaises(KeyError):
+            s.remove(5)
+        self.assertEqual([1, 2], list(s))